@@ -11,4 +11,14 @@ class ModelVerificationError(Exception):
 class ChatResponseError(Exception):
     """
     Raised when model interaction fails.
-    """
\ No newline at end of file
+    """
+
+class FabricError(Exception):
+    """
+    Raised when the coordinator/worker fabric cannot complete an operation.
+    """
+
+class ContextOverflowError(ChatResponseError):
+    """
+    Raised when a prompt cannot fit in the model's context window.
+    """
@@ -0,0 +1,678 @@
+import logging
+import multiprocessing
+import os
+import queue
+import signal
+import socket
+import struct
+import threading
+import time
+import traceback
+import uuid
+
+from collections import deque
+from dataclasses import dataclass, field
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Client, Connection, answer_challenge, deliver_challenge
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Set, Tuple, Union
+
+from app.core.exceptions import FabricError
+from app.core.utils import chunked
+
+Address = Union[Tuple[str, int], str]
+
+DEFAULT_ADDRESS: Tuple[str, int] = ("127.0.0.1", 0)
+AUTHKEY_ENV: str = "TURING_NG_AUTHKEY"
+DEFAULT_HEARTBEAT_INTERVAL: float = 2.0
+DEFAULT_HEARTBEAT_TIMEOUT: float = 10.0
+DEFAULT_POLL_INTERVAL: float = 0.5
+HANDSHAKE_TIMEOUT: float = 5.0
+
+# Protocol messages are plain tuples whose first element is the message kind.
+# worker -> coordinator
+MSG_PULL = "pull"               # ("pull", worker_id)                           -> ("unit", WorkUnit) | ("wait", seconds) | ("done", None)
+MSG_HEARTBEAT = "heartbeat"     # ("heartbeat", worker_id, unit_id)             -> no reply
+MSG_RESULT = "result"           # ("result", worker_id, WorkResult)             -> ("ack", unit_id)
+# coordinator -> worker
+MSG_UNIT = "unit"
+MSG_WAIT = "wait"
+MSG_DONE = "done"
+MSG_ACK = "ack"
+
+logger = logging.getLogger("turing-ng")
+
+
+@dataclass
+class WorkUnit:
+    """A shard of a campaign handed to a single worker."""
+    payload: Dict[str, Any]
+    unit_id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    attempts: int = 0
+
+    @property
+    def size(self) -> int:
+        """The number of items (prompts) in the unit; units without prompts count as one."""
+        return len(self.payload.get("prompts") or []) or 1
+
+
+@dataclass
+class WorkResult:
+    """The outcome of running a work unit on a worker."""
+    unit_id: str
+    worker_id: str
+    value: Any = None
+    error: Optional[str] = None
+    attempts: int = 0
+    size: int = 1
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass
+class _Lease:
+    unit: WorkUnit
+    worker_id: str
+    last_seen: float
+
+
+def parse_address(text: str) -> Address:
+    """Parses 'host:port' into a (host, port) tuple; anything else is treated as a UNIX socket path."""
+    host, sep, port = text.rpartition(":")
+    if sep and port.isdigit():
+        return (host, int(port))
+    return text
+
+
+def format_address(address: Address) -> str:
+    """Formats an address the way `parse_address` reads it."""
+    if isinstance(address, tuple):
+        return f"{address[0]}:{address[1]}"
+    return address
+
+
+def default_authkey() -> Optional[bytes]:
+    """Returns the shared secret from the TURING_NG_AUTHKEY environment variable, if set."""
+    value = os.environ.get(AUTHKEY_ENV)
+    return value.encode() if value else None
+
+
+def _set_io_timeout(sock: socket.socket, seconds: float) -> None:
+    """Sets send/receive timeouts on a blocking socket. A timed-out read or write raises OSError; 0 disables."""
+    value = struct.pack("ll", int(seconds), int(seconds % 1 * 1_000_000))
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVTIMEO, value)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDTIMEO, value)
+
+
+def chat_handler(unit: WorkUnit, worker: "Worker") -> List[Dict[str, Any]]:
+    """
+    Default work unit handler. Sends every prompt in the unit to the worker's LLM client.
+
+    The unit payload is expected to contain:
+        llm (str):                  The registered LLM client name (e.g., 'ollama').
+        llm_args (Dict[str, Any]):  Keyword arguments for the LLM client constructor.
+        prompts (List[str]):        The prompts to send.
+        system_prompt (str):        Optional system prompt applied to every prompt.
+
+    Returns:
+        List[Dict[str, Any]]: One record per prompt with the prompt, response, and error (if any).
+    """
+    payload = unit.payload
+    client = worker.get_client(payload["llm"], payload.get("llm_args") or {})
+    records: List[Dict[str, Any]] = []
+    for prompt in payload.get("prompts", []):
+        try:
+            response, _ = client.chat(prompt, system_prompt=payload.get("system_prompt"))
+            records.append({"prompt": prompt, "response": response, "error": None})
+        except Exception as ex:
+            records.append({"prompt": prompt, "response": None, "error": str(ex)})
+    return records
+
+
+def shard_campaign(
+        prompts: List[str],
+        llm: str,
+        llm_args: Optional[Dict[str, Any]] = None,
+        system_prompt: Optional[str] = None,
+        unit_size: int = 10
+) -> List[WorkUnit]:
+    """
+    Splits a list of prompts into work units understood by `chat_handler`.
+
+    Args:
+        prompts (List[str]):                    The campaign prompts.
+        llm (str):                              The registered LLM client name workers should use.
+        llm_args (Optional[Dict[str, Any]]):    Keyword arguments for the LLM client constructor.
+        system_prompt (Optional[str]):          Optional system prompt applied to every prompt.
+        unit_size (int):                        The maximum number of prompts per work unit.
+
+    Returns:
+        List[WorkUnit]: The work units, in prompt order.
+    """
+    return [
+        WorkUnit(payload={
+            "llm": llm,
+            "llm_args": dict(llm_args or {}),
+            "prompts": chunk,
+            "system_prompt": system_prompt
+        })
+        for chunk in chunked(prompts, unit_size)
+    ]
+
+
+class Coordinator:
+    """
+    Hands work units out to worker processes and collects their results.
+
+    Workers connect over a local TCP or UNIX socket, pull one unit at a time, and send a heartbeat while
+    the unit is running. Units whose worker disconnects or misses heartbeats for `heartbeat_timeout`
+    seconds are requeued, so every unit is delivered at least once. Duplicate results for the same unit
+    are discarded; the first result received wins.
+    """
+    def __init__(
+            self,
+            address: Address = DEFAULT_ADDRESS,
+            authkey: Optional[bytes] = None,
+            heartbeat_timeout: float = DEFAULT_HEARTBEAT_TIMEOUT,
+            poll_interval: float = DEFAULT_POLL_INTERVAL
+    ) -> None:
+        """
+        Initialize a Coordinator.
+
+        Args:
+            address (Address):          A (host, port) tuple or a UNIX socket path. Port 0 picks a free port.
+            authkey (Optional[bytes]):  Shared secret workers must present. Defaults to $TURING_NG_AUTHKEY; a random
+                                        key (usable by local workers only) is generated if neither is set.
+            heartbeat_timeout (float):  Seconds without a heartbeat before a running unit is reassigned.
+            poll_interval (float):      Seconds an idle worker waits before pulling again.
+        """
+        self._requested_address = address
+        self._authkey = authkey or default_authkey() or os.urandom(32)
+        self._heartbeat_timeout = heartbeat_timeout
+        self._poll_interval = poll_interval
+        self._listener: Optional[socket.socket] = None
+        self._threads: List[threading.Thread] = []
+        self._processes: List[multiprocessing.Process] = []
+        self._cond = threading.Condition()
+        self._pending: Deque[WorkUnit] = deque()
+        self._leases: Dict[str, _Lease] = {}
+        self._completed: Set[str] = set()
+        self._results: Dict[str, WorkResult] = {}
+        self._stream: "queue.Queue[WorkResult]" = queue.Queue()
+        self._submitted = 0
+        self._closing = False
+        self._stopped = threading.Event()
+        self._connections = 0
+
+
+    #################################################################################
+    #   Private Methods                                                             #
+    #################################################################################
+    def _bind(self) -> socket.socket:
+        address = self._requested_address
+        family = socket.AF_UNIX if isinstance(address, str) else socket.AF_INET
+        sock = socket.socket(family, socket.SOCK_STREAM)
+        try:
+            if family == socket.AF_INET:
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            sock.bind(address)
+            sock.listen(socket.SOMAXCONN)
+        except OSError:
+            sock.close()
+            raise
+        return sock
+
+    def _accept_loop(self) -> None:
+        # authentication happens on the per-connection thread so a silent peer cannot stall accept()
+        while not self._stopped.is_set():
+            try:
+                sock, _ = self._listener.accept()
+            except OSError as ex:
+                if self._stopped.is_set():
+                    return
+                logger.warning(f"Fabric: accept failed: {ex}")
+                continue
+            if self._stopped.is_set():
+                sock.close()
+                return
+            thread = threading.Thread(target=self._serve, args=(sock,), daemon=True)
+            thread.start()
+
+    def _authenticate(self, sock: socket.socket) -> Optional[Connection]:
+        """Runs the authkey handshake under a timeout. Returns the connection, or None if the peer failed it."""
+        try:
+            _set_io_timeout(sock, HANDSHAKE_TIMEOUT)
+        except OSError:
+            sock.close()
+            return None
+        conn = Connection(sock.detach())
+        try:
+            deliver_challenge(conn, self._authkey)
+            answer_challenge(conn, self._authkey)
+            with socket.socket(fileno=os.dup(conn.fileno())) as handle:
+                _set_io_timeout(handle, 0)
+            return conn
+        except (OSError, EOFError, AuthenticationError) as ex:
+            logger.warning(f"Fabric: rejected worker connection: {ex or type(ex).__name__}")
+            conn.close()
+            return None
+
+    def _serve(self, sock: socket.socket) -> None:
+        """Authenticates and serves a single worker connection until it closes."""
+        conn = self._authenticate(sock)
+        if conn is None:
+            return
+        worker_id: Optional[str] = None
+        with self._cond:
+            self._connections += 1
+        try:
+            while not self._stopped.is_set():
+                message = conn.recv()
+                kind, worker_id = message[0], message[1]
+                if kind == MSG_PULL:
+                    conn.send(self._next_unit(worker_id))
+                elif kind == MSG_HEARTBEAT:
+                    self._heartbeat(worker_id, message[2])
+                elif kind == MSG_RESULT:
+                    result: WorkResult = message[2]
+                    self._complete(result)
+                    conn.send((MSG_ACK, result.unit_id))
+                else:
+                    logger.warning(f"Fabric: unknown message '{kind}' from worker {worker_id}")
+        except (EOFError, OSError):
+            pass
+        finally:
+            conn.close()
+            with self._cond:
+                self._connections -= 1
+            if worker_id:
+                self._release_worker(worker_id)
+
+    def _next_unit(self, worker_id: str) -> Tuple[str, Any]:
+        with self._cond:
+            while self._pending:
+                unit = self._pending.popleft()
+                if unit.unit_id in self._completed:
+                    continue
+                unit.attempts += 1
+                self._leases[unit.unit_id] = _Lease(unit=unit, worker_id=worker_id, last_seen=time.monotonic())
+                logger.info(f"Fabric: unit {unit.unit_id} assigned to {worker_id} (attempt {unit.attempts})")
+                return (MSG_UNIT, unit)
+            # leased units may still be requeued, so idle workers stay until nothing is left in flight
+            if self._closing and not self._leases:
+                return (MSG_DONE, None)
+            return (MSG_WAIT, self._poll_interval)
+
+    def _heartbeat(self, worker_id: str, unit_id: str) -> None:
+        with self._cond:
+            lease = self._leases.get(unit_id)
+            if lease and lease.worker_id == worker_id:
+                lease.last_seen = time.monotonic()
+
+    def _complete(self, result: WorkResult) -> None:
+        with self._cond:
+            if result.unit_id in self._completed:
+                logger.info(f"Fabric: duplicate result for unit {result.unit_id} from {result.worker_id} discarded")
+                return
+            self._completed.add(result.unit_id)
+            self._leases.pop(result.unit_id, None)
+            self._results[result.unit_id] = result
+            self._cond.notify_all()
+        self._stream.put(result)
+
+    def _release_worker(self, worker_id: str) -> None:
+        """Requeues every unit leased by a worker whose connection dropped."""
+        with self._cond:
+            for unit_id, lease in list(self._leases.items()):
+                if lease.worker_id == worker_id:
+                    self._requeue(unit_id, f"worker {worker_id} disconnected")
+
+    def _requeue(self, unit_id: str, reason: str) -> None:
+        """Moves a leased unit back to the front of the queue. Caller must hold the lock."""
+        lease = self._leases.pop(unit_id)
+        self._pending.appendleft(lease.unit)
+        logger.warning(f"Fabric: unit {unit_id} requeued ({reason})")
+
+    def _reap_loop(self) -> None:
+        interval = max(self._heartbeat_timeout / 4, 0.05)
+        while not self._stopped.wait(interval):
+            now = time.monotonic()
+            with self._cond:
+                for unit_id, lease in list(self._leases.items()):
+                    if now - lease.last_seen > self._heartbeat_timeout:
+                        self._requeue(unit_id, f"worker {lease.worker_id} missed heartbeats")
+
+
+    #################################################################################
+    # PUBLIC PROPERTIES                                                             #
+    #################################################################################
+    @property
+    def address(self) -> Address:
+        """The bound address workers should connect to."""
+        if not self._listener:
+            raise FabricError("Coordinator has not been started.")
+        return self._listener.getsockname()
+
+    @property
+    def authkey(self) -> bytes:
+        return self._authkey
+
+    @property
+    def progress(self) -> Tuple[int, int]:
+        """Returns (completed, submitted) unit counts."""
+        with self._cond:
+            return len(self._completed), self._submitted
+
+    @property
+    def stalled(self) -> bool:
+        """True if units are outstanding but every spawned local worker has exited and no worker is connected."""
+        with self._cond:
+            if not self._processes or self._connections or len(self._completed) >= self._submitted:
+                return False
+        return not any(process.is_alive() for process in self._processes)
+
+
+    #################################################################################
+    # PUBLIC METHODS                                                                #
+    #################################################################################
+    def start(self) -> "Coordinator":
+        """Binds the listener and starts the accept and lease-reaper threads."""
+        if self._listener:
+            raise FabricError("Coordinator is already running.")
+        try:
+            self._listener = self._bind()
+        except OSError as ex:
+            raise FabricError(f"Unable to listen on {self._requested_address}: {ex}")
+        for target in (self._accept_loop, self._reap_loop):
+            thread = threading.Thread(target=target, daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        logger.info(f"Fabric: coordinator listening on {self.address}")
+        return self
+
+    def submit(self, units: List[WorkUnit]) -> List[str]:
+        """
+        Queues work units for the workers.
+
+        Args:
+            units (List[WorkUnit]): The units to queue.
+
+        Returns:
+            List[str]: The queued unit ids, in order.
+        """
+        with self._cond:
+            if self._closing:
+                raise FabricError("Coordinator is closed to new work.")
+            self._pending.extend(units)
+            self._submitted += len(units)
+        return [unit.unit_id for unit in units]
+
+    def close(self) -> None:
+        """Stops accepting work. Workers exit once no units are pending or running."""
+        with self._cond:
+            self._closing = True
+
+    def spawn_local_workers(
+            self,
+            count: int,
+            handler: Callable[[WorkUnit, "Worker"], Any] = chat_handler,
+            heartbeat_interval: float = DEFAULT_HEARTBEAT_INTERVAL
+    ) -> List[multiprocessing.Process]:
+        """
+        Starts worker processes on this host connected to this coordinator.
+
+        Args:
+            count (int):                    The number of worker processes to start.
+            handler (Callable):             A module-level function run for each unit.
+            heartbeat_interval (float):     Seconds between worker heartbeats.
+
+        Returns:
+            List[multiprocessing.Process]: The started processes.
+        """
+        ctx = multiprocessing.get_context("spawn")
+        processes: List[multiprocessing.Process] = []
+        for _ in range(count):
+            process = ctx.Process(
+                target=run_worker,
+                args=(self.address, self._authkey, handler, heartbeat_interval),
+                daemon=True
+            )
+            process.start()
+            processes.append(process)
+        self._processes.extend(processes)
+        return processes
+
+    def iter_results(self, timeout: Optional[float] = None) -> Iterator[WorkResult]:
+        """
+        Yields results as they arrive until every submitted unit has completed or the coordinator is stopped.
+
+        Args:
+            timeout (Optional[float]):  Seconds to wait for the next result before raising FabricError.
+
+        Returns:
+            Iterator[WorkResult]: Results in completion order.
+
+        Raises:
+            FabricError: If no result arrives within `timeout`, or local workers were spawned and none remain.
+        """
+        yielded = 0
+        while True:
+            with self._cond:
+                if yielded >= self._submitted and self._stream.empty():
+                    return
+            deadline = None if timeout is None else time.monotonic() + timeout
+            while True:
+                try:
+                    result = self._stream.get(timeout=DEFAULT_POLL_INTERVAL)
+                    break
+                except queue.Empty:
+                    if self._stopped.is_set():
+                        return
+                    if self.stalled:
+                        completed, submitted = self.progress
+                        raise FabricError(f"{submitted - completed} unit(s) outstanding with no live workers.")
+                    if deadline is not None and time.monotonic() >= deadline:
+                        raise FabricError(f"No result received within {timeout} seconds.")
+            yielded += 1
+            yield result
+
+    def wait(self, timeout: Optional[float] = None) -> Dict[str, WorkResult]:
+        """
+        Blocks until every submitted unit has completed.
+
+        Args:
+            timeout (Optional[float]):  Maximum seconds to wait in total.
+
+        Returns:
+            Dict[str, WorkResult]: Results keyed by unit id.
+
+        Raises:
+            FabricError: If the timeout elapses first.
+        """
+        with self._cond:
+            done = self._cond.wait_for(lambda: len(self._completed) >= self._submitted, timeout=timeout)
+            if not done:
+                raise FabricError(f"{self._submitted - len(self._completed)} unit(s) still outstanding after {timeout} seconds.")
+            return dict(self._results)
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Closes the fabric, waits for local workers to exit, and releases the listener."""
+        self.close()
+        for process in self._processes:
+            process.join(timeout)
+            if process.is_alive():
+                process.terminate()
+        self._processes.clear()
+        if self._stopped.is_set():
+            return
+        self._stopped.set()
+        if self._listener:
+            # shutdown() wakes the thread blocked in accept(); close() alone does not
+            try:
+                self._listener.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+            self._listener.close()
+            if isinstance(self._requested_address, str) and os.path.exists(self._requested_address):
+                os.unlink(self._requested_address)
+
+    def __enter__(self) -> "Coordinator":
+        return self.start()
+
+    def __exit__(self, *_) -> None:
+        self.stop()
+
+
+class Worker:
+    """
+    Pulls work units from a Coordinator and runs them through its own LLM clients.
+
+    A worker keeps at most one unit in flight. While the unit runs a background thread sends heartbeats;
+    if the coordinator connection drops, the worker reconnects and re-sends any unacknowledged result.
+    """
+    def __init__(
+            self,
+            address: Address,
+            authkey: bytes,
+            handler: Callable[[WorkUnit, "Worker"], Any] = chat_handler,
+            heartbeat_interval: float = DEFAULT_HEARTBEAT_INTERVAL,
+            max_reconnects: int = 5
+    ) -> None:
+        """
+        Initialize a Worker.
+
+        Args:
+            address (Address):          The coordinator's (host, port) tuple or UNIX socket path.
+            authkey (bytes):            The coordinator's shared secret.
+            handler (Callable):         Function run for each unit; its return value becomes the result value.
+            heartbeat_interval (float): Seconds between heartbeats while a unit is running.
+            max_reconnects (int):       Consecutive failed connection attempts before giving up.
+        """
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self._address = address
+        self._authkey = authkey
+        self._handler = handler
+        self._heartbeat_interval = heartbeat_interval
+        self._max_reconnects = max_reconnects
+        self._clients: Dict[Tuple[str, Tuple[Tuple[str, Any], ...]], Any] = {}
+        self._send_lock = threading.Lock()
+        self._unacked: Optional[WorkResult] = None
+
+
+    #################################################################################
+    #   Private Methods                                                             #
+    #################################################################################
+    def _send(self, conn: Connection, message: Tuple[Any, ...]) -> None:
+        with self._send_lock:
+            conn.send(message)
+
+    def _request(self, conn: Connection, message: Tuple[Any, ...]) -> Tuple[str, Any]:
+        # heartbeats never get a reply, so the next message received always answers this request
+        self._send(conn, message)
+        return conn.recv()
+
+    def _deliver(self, conn: Connection) -> None:
+        while self._unacked is not None:
+            kind, unit_id = self._request(conn, (MSG_RESULT, self.worker_id, self._unacked))
+            if kind == MSG_ACK and unit_id == self._unacked.unit_id:
+                self._unacked = None
+
+    def _run_unit(self, conn: Connection, unit: WorkUnit) -> WorkResult:
+        stop = threading.Event()
+
+        def beat() -> None:
+            while not stop.wait(self._heartbeat_interval):
+                try:
+                    self._send(conn, (MSG_HEARTBEAT, self.worker_id, unit.unit_id))
+                except (OSError, EOFError):
+                    return
+
+        beater = threading.Thread(target=beat, daemon=True)
+        beater.start()
+        try:
+            value = self._handler(unit, self)
+            return WorkResult(unit_id=unit.unit_id, worker_id=self.worker_id, value=value,
+                              attempts=unit.attempts, size=unit.size)
+        except Exception:
+            return WorkResult(unit_id=unit.unit_id, worker_id=self.worker_id, error=traceback.format_exc(),
+                              attempts=unit.attempts, size=unit.size)
+        finally:
+            stop.set()
+            beater.join()
+
+    def _session(self, conn: Connection) -> bool:
+        """Runs units over one connection. Returns True once the coordinator reports it is done."""
+        self._deliver(conn)
+        while True:
+            kind, body = self._request(conn, (MSG_PULL, self.worker_id))
+            if kind == MSG_DONE:
+                return True
+            if kind == MSG_WAIT:
+                time.sleep(body)
+                continue
+            self._unacked = self._run_unit(conn, body)
+            self._deliver(conn)
+
+
+    #################################################################################
+    # PUBLIC METHODS                                                                #
+    #################################################################################
+    def get_client(self, name: str, kwargs: Dict[str, Any]) -> Any:
+        """
+        Returns a cached LLM client for this worker, creating it on first use.
+
+        Args:
+            name (str):                 The registered LLM client name (e.g., 'ollama').
+            kwargs (Dict[str, Any]):    Keyword arguments for the client constructor.
+
+        Raises:
+            FabricError: If no LLM client is registered under the name.
+        """
+        key = (name, tuple(sorted(kwargs.items())))
+        if key not in self._clients:
+            # importing the client modules populates the registry
+            import app.llms.ollama  # noqa: F401
+            from app.llms.registry import LLM_REGISTRY
+            if name not in LLM_REGISTRY:
+                raise FabricError(f"LLM client '{name}' is not registered.")
+            self._clients[key] = LLM_REGISTRY[name](**kwargs)
+        return self._clients[key]
+
+    def run(self) -> None:
+        """
+        Connects to the coordinator and processes units until it reports it is done.
+
+        Raises:
+            FabricError: If the coordinator cannot be reached after `max_reconnects` attempts.
+        """
+        failures = 0
+        while True:
+            try:
+                conn = Client(self._address, authkey=self._authkey)
+            except (OSError, EOFError) as ex:
+                if failures >= self._max_reconnects:
+                    raise FabricError(f"Unable to reach coordinator at {self._address}: {ex}")
+                time.sleep(min(2 ** failures * 0.1, 5.0))
+                failures += 1
+                continue
+            failures = 0
+            try:
+                with conn:
+                    if self._session(conn):
+                        return
+            except (OSError, EOFError) as ex:
+                logger.warning(f"Fabric: worker {self.worker_id} lost coordinator connection: {ex}")
+                continue
+
+
+def run_worker(
+        address: Address,
+        authkey: bytes,
+        handler: Callable[[WorkUnit, Worker], Any] = chat_handler,
+        heartbeat_interval: float = DEFAULT_HEARTBEAT_INTERVAL
+) -> None:
+    """Process entry point for a worker. See `Worker`."""
+    # local workers share the shell's process group; Ctrl-C there is meant for the shell, not its jobs
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    Worker(address, authkey, handler=handler, heartbeat_interval=heartbeat_interval).run()
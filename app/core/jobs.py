@@ -0,0 +1,176 @@
+import threading
+import time
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from app.core.fabric import Coordinator, WorkResult
+
+STATE_RUNNING = "running"
+STATE_DONE = "done"
+STATE_FAILED = "failed"
+STATE_KILLED = "killed"
+
+
+@dataclass
+class JobProgress:
+    """Point-in-time progress snapshot for a job."""
+    units_done: int
+    units_total: int
+    items: int
+    errors: int
+    elapsed: float
+
+    @property
+    def throughput(self) -> float:
+        """Items (e.g., prompts) completed per second."""
+        return self.items / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def error_rate(self) -> float:
+        return self.errors / self.items if self.items else 0.0
+
+    @property
+    def eta(self) -> Optional[float]:
+        """Estimated seconds remaining, or None until the first unit completes."""
+        if not self.units_done:
+            return None
+        return self.elapsed / self.units_done * (self.units_total - self.units_done)
+
+
+class Job:
+    """
+    A campaign running in the background.
+
+    A collector thread drains the coordinator's results into `results` as they arrive, so they can be
+    inspected while the campaign is still running.
+    """
+    def __init__(self, job_id: int, description: str, coordinator: Coordinator) -> None:
+        self.job_id = job_id
+        self.description = description
+        self.state = STATE_RUNNING
+        self.error: Optional[str] = None
+        self._coordinator = coordinator
+        self._lock = threading.Lock()
+        self._results: List[WorkResult] = []
+        self._items = 0
+        self._errors = 0
+        self._started = time.monotonic()
+        self._finished: Optional[float] = None
+        self._thread = threading.Thread(target=self._collect, daemon=True)
+        self._thread.start()
+
+
+    #################################################################################
+    #   Private Methods                                                             #
+    #################################################################################
+    def _collect(self) -> None:
+        try:
+            for result in self._coordinator.iter_results():
+                self._record(result)
+            self._coordinator.stop()
+            self._finish(STATE_DONE)
+        except Exception as ex:
+            self.error = str(ex)
+            self._coordinator.stop(timeout=0)
+            self._finish(STATE_FAILED)
+
+    def _record(self, result: WorkResult) -> None:
+        # every item of a failed unit counts as errored; successful units count each record they return
+        if not result.ok:
+            items, errors = result.size, result.size
+        elif isinstance(result.value, list):
+            items = len(result.value)
+            errors = sum(1 for record in result.value if isinstance(record, dict) and record.get("error"))
+        else:
+            items, errors = result.size, 0
+        with self._lock:
+            self._results.append(result)
+            self._items += items
+            self._errors += errors
+
+    def _finish(self, state: str) -> None:
+        with self._lock:
+            if self.state == STATE_RUNNING:
+                self.state = state
+                self._finished = time.monotonic()
+
+
+    #################################################################################
+    # PUBLIC PROPERTIES                                                             #
+    #################################################################################
+    @property
+    def is_running(self) -> bool:
+        return self.state == STATE_RUNNING
+
+    @property
+    def results(self) -> List[WorkResult]:
+        """Results received so far, in completion order."""
+        with self._lock:
+            return list(self._results)
+
+    @property
+    def progress(self) -> JobProgress:
+        units_done, units_total = self._coordinator.progress
+        with self._lock:
+            end = self._finished or time.monotonic()
+            return JobProgress(
+                units_done=units_done,
+                units_total=units_total,
+                items=self._items,
+                errors=self._errors,
+                elapsed=end - self._started
+            )
+
+
+    #################################################################################
+    # PUBLIC METHODS                                                                #
+    #################################################################################
+    def kill(self) -> None:
+        """Stops the job immediately. Results received so far are kept."""
+        self._finish(STATE_KILLED)
+        self._coordinator.stop(timeout=0)
+
+    def join(self, timeout: Optional[float] = None) -> bool:
+        """Waits for the job to finish. Returns True if it has finished."""
+        self._thread.join(timeout)
+        return not self._thread.is_alive()
+
+
+class JobManager:
+    """Tracks background jobs by a sequential integer id."""
+    def __init__(self) -> None:
+        self._jobs: Dict[int, Job] = {}
+        self._next_id = 1
+        self._lock = threading.Lock()
+
+    def add(self, description: str, coordinator: Coordinator) -> Job:
+        """Starts tracking a job for a running coordinator."""
+        with self._lock:
+            job = Job(self._next_id, description, coordinator)
+            self._jobs[job.job_id] = job
+            self._next_id += 1
+        return job
+
+    def get(self, job_id: Any) -> Job:
+        """
+        Retrieves a job by id.
+
+        Raises:
+            KeyError: If no job has the id.
+        """
+        try:
+            return self._jobs[int(job_id)]
+        except (KeyError, TypeError, ValueError):
+            raise KeyError(f"Job '{job_id}' not found")
+
+    def list(self) -> List[Job]:
+        with self._lock:
+            return list(self._jobs.values())
+
+    def running(self) -> List[Job]:
+        return [job for job in self.list() if job.is_running]
+
+    def kill_all(self) -> None:
+        for job in self.running():
+            job.kill()
@@ -3,9 +3,11 @@ import sys
 import logging
 import random
 
-from typing import List, Any
+from typing import List, Any, Dict, Optional
 
 from app.interfaces.cli.console import Console
+from app.core.fabric import Address, Coordinator, DEFAULT_ADDRESS, format_address, shard_campaign
+from app.core.jobs import JobManager
 from app.core.options import Option, OptionRegistry
 
 class Turing:
@@ -19,6 +21,7 @@ class Turing:
         self._init_home()
         self._logger = self._init_logger()
         self._options = self._init_options()
+        self._jobs = JobManager()
         self._logger.info("Core initialized")
     
 
@@ -74,6 +77,10 @@ class Turing:
     def name(self) -> str:
         return self._name    
 
+    @property
+    def jobs(self) -> JobManager:
+        return self._jobs
+
 
     #################################################################################
     # MISC PUBLIC METHODS                                                           #
@@ -182,4 +189,58 @@ class Turing:
         pass
 
     def unset_option(self, name: str) -> None:
-        pass
\ No newline at end of file
+        pass
+
+
+    #################################################################################
+    # PUBLIC FABRIC METHODS                                                         #
+    #################################################################################
+    def start_campaign(
+            self,
+            prompts: List[str],
+            llm: str,
+            llm_args: Optional[Dict[str, Any]] = None,
+            system_prompt: Optional[str] = None,
+            workers: Optional[int] = None,
+            unit_size: int = 10,
+            address: Address = DEFAULT_ADDRESS,
+            authkey: Optional[bytes] = None
+    ) -> Coordinator:
+        """
+        Shards a campaign into work units and starts a coordinator to run them.
+
+        Args:
+            prompts (List[str]):                    The campaign prompts.
+            llm (str):                              The registered LLM client name workers should use.
+            llm_args (Optional[Dict[str, Any]]):    Keyword arguments for the LLM client constructor.
+            system_prompt (Optional[str]):          Optional system prompt applied to every prompt.
+            workers (Optional[int]):                Local worker processes to spawn. Defaults to the CPU count;
+                                                    use 0 to rely on remote workers only.
+            unit_size (int):                        The maximum number of prompts per work unit.
+            address (Address):                      The address remote workers connect to.
+            authkey (Optional[bytes]):              Shared secret for remote workers. Defaults to $TURING_NG_AUTHKEY,
+                                                    or a random key usable by local workers only.
+
+        Returns:
+            Coordinator: The running coordinator. Use iter_results() or wait() to collect results, then stop().
+
+        Raises:
+            ValueError:     If unit_size is not positive or workers is negative. Nothing is started.
+            FabricError:    If the coordinator cannot listen on the address.
+        """
+        units = shard_campaign(prompts, llm, llm_args=llm_args, system_prompt=system_prompt, unit_size=unit_size)
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if workers < 0:
+            raise ValueError(f"Workers expected to be a non-negative integer, got '{workers}'")
+        coordinator = Coordinator(address=address, authkey=authkey).start()
+        try:
+            coordinator.submit(units)
+            coordinator.close()
+            if workers:
+                coordinator.spawn_local_workers(min(workers, len(units)))
+        except Exception:
+            coordinator.stop(timeout=0)
+            raise
+        self._logger.info(f"Campaign started: {len(units)} unit(s) on {format_address(coordinator.address)}")
+        return coordinator
@@ -0,0 +1,25 @@
+from typing import Iterable, Iterator, List, TypeVar
+
+T = TypeVar("T")
+
+def chunked(items: Iterable[T], size: int) -> Iterator[List[T]]:
+    """
+    Splits an iterable into consecutive lists of at most `size` items.
+
+    Args:
+        items (Iterable[T]):    The items to split.
+        size (int):             The maximum number of items per chunk.
+
+    Returns:
+        Iterator[List[T]]: The chunks, in order.
+    """
+    if size <= 0:
+        raise ValueError(f"Size expected to be a positive integer, got '{size}'")
+    chunk: List[T] = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
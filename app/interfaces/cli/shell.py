@@ -1,15 +1,55 @@
+import argparse
 import cmd2
 import shlex
+import threading
 
 from cmd2 import Cmd
 from cmd2.plugin import PostcommandData
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Set
 
 from app.core.turing import Turing
+from app.core.fabric import DEFAULT_ADDRESS, format_address, parse_address
+from app.core.jobs import Job
 from app.core.options import Option
 from app.interfaces.cli.console import Console
 from app.core.version import get_version
 
+PROGRESS_INTERVAL: float = 10.0
+STATUS_INTERVAL: float = 2.0
+
+def positive_int(value: str) -> int:
+    """argparse type for integers greater than zero."""
+    number = int(value)
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"expected a positive integer, got '{value}'")
+    return number
+
+def non_negative_int(value: str) -> int:
+    """argparse type for integers of zero or more."""
+    number = int(value)
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"expected a non-negative integer, got '{value}'")
+    return number
+
+run_parser = cmd2.Cmd2ArgumentParser(description="Runs a campaign of prompts against a model.")
+run_parser.add_argument("prompts", help="file containing one prompt per line")
+run_parser.add_argument("-m", "--model", required=True, help="target model name")
+run_parser.add_argument("-l", "--llm", default="ollama", help="LLM client name (default: ollama)")
+run_parser.add_argument("--host", help="LLM server URL")
+run_parser.add_argument("-s", "--system", help="system prompt applied to every prompt")
+run_parser.add_argument("-w", "--workers", type=non_negative_int, help="local worker processes, 0 for remote workers only (default: CPU count)")
+run_parser.add_argument("-u", "--unit-size", type=positive_int, default=10, help="prompts per work unit (default: 10)")
+run_parser.add_argument("--listen", default=format_address(DEFAULT_ADDRESS), help="coordinator address for workers, host:port or a UNIX socket path (default: 127.0.0.1 on a free port)")
+run_parser.add_argument("--authkey", help="shared secret for remote workers (default: $TURING_NG_AUTHKEY)")
+run_parser.add_argument("-b", "--background", action="store_true", help="run as a background job")
+
+job_parser = cmd2.Cmd2ArgumentParser(description="Displays a job's progress and results.")
+job_parser.add_argument("job_id", help="job id")
+job_parser.add_argument("-n", "--count", type=int, default=10, help="number of most recent results to display (default: 10)")
+
+kill_parser = cmd2.Cmd2ArgumentParser(description="Kills a running job.")
+kill_parser.add_argument("job_id", help="job id")
+
 class TuringShell(cmd2.Cmd):
     """"""
     def __init__(self, turing: Turing) -> None:
@@ -17,6 +57,8 @@ class TuringShell(cmd2.Cmd):
         self._help_color = Console.Color.GRAY
         self._init_cmd2()
         self._turing = turing
+        self._announced: Set[int] = set()
+        self._ticker_stop = threading.Event()
         
 
     def _init_cmd2(self) -> None:
@@ -114,17 +156,61 @@ class TuringShell(cmd2.Cmd):
         print(MAGENTA + tagline.center(content_width) + RESET)
         print()
 
-    def _set_prompt(self) -> None:
+    def _build_prompt(self) -> str:
         prompt_core: str = "turing"
         debug_indicator = Console.color_text("(debug) ", [Console.Color.YELLOW]) if self._turing.is_debug else ""
         prompt_root = Console.color_text(f"{prompt_core}", [Console.Color.CYAN])
         prompt_suffix = Console.color_text(">", [Console.Color.CYAN])
-        self.prompt = f"{debug_indicator}{prompt_root}{prompt_suffix} "
+        return f"{self._job_status()}{debug_indicator}{prompt_root}{prompt_suffix} "
+
+    def _set_prompt(self) -> None:
+        self.prompt = self._build_prompt()
     
     def _postcmd_hook(self, data: PostcommandData) -> PostcommandData:
         self._set_prompt()
         return data
     
+    def _format_progress(self, job: Job) -> str:
+        """Formats a single-line progress summary for a job."""
+        progress = job.progress
+        eta = "--" if progress.eta is None else f"{progress.eta:.0f}s"
+        return (f"Job {job.job_id} [{job.state}] {progress.units_done}/{progress.units_total} units | "
+                f"{progress.throughput:.1f} prompts/s | ETA {eta} | errors {progress.error_rate:.1%}")
+
+    def _job_status(self) -> str:
+        """Formats a compact status segment for the prompt with one entry per running job."""
+        entries: List[str] = []
+        for job in self._turing.jobs.running():
+            progress = job.progress
+            eta = "--" if progress.eta is None else f"{progress.eta:.0f}s"
+            entries.append(f"{job.job_id}: {progress.units_done}/{progress.units_total} "
+                           f"{progress.throughput:.1f}/s ETA {eta} err {progress.error_rate:.0%}")
+        if not entries:
+            return ""
+        return Console.color_text(f"[{' | '.join(entries)}] ", [Console.Color.MAGENTA])
+
+    def _progress_ticker(self) -> None:
+        """Redraws background job progress in the prompt, and announces finished jobs, while it is idle."""
+        while not self._ticker_stop.wait(STATUS_INTERVAL):
+            finished: List[Job] = [
+                job for job in self._turing.jobs.list()
+                if not job.is_running and job.job_id not in self._announced
+            ]
+            prompt = self._build_prompt()
+            if not finished and prompt == self.prompt:
+                continue
+            # the lock is only free while the prompt is waiting for input; skip this tick otherwise
+            if self.terminal_lock.acquire(blocking=False):
+                try:
+                    if finished:
+                        lines = [f"{self._format_progress(job)} (finished)" for job in finished]
+                        self.async_alert(Console.color_text("\n".join(lines), [Console.Color.GREEN]), new_prompt=prompt)
+                        self._announced.update(job.job_id for job in finished)
+                    else:
+                        self.async_update_prompt(prompt)
+                finally:
+                    self.terminal_lock.release()
+
     def _display_options(self, options: List[Option]) -> None:
         """Displays options in a uniform way."""
         if not options:
@@ -155,7 +241,13 @@ class TuringShell(cmd2.Cmd):
     def start(self) -> None:
         self._display_banner()
         self._set_prompt()
-        self.cmdloop()
+        ticker = threading.Thread(target=self._progress_ticker, daemon=True)
+        ticker.start()
+        try:
+            self.cmdloop()
+        finally:
+            self._ticker_stop.set()
+            self._turing.jobs.kill_all()
 
 
     #################################################################################
@@ -177,6 +269,96 @@ class TuringShell(cmd2.Cmd):
         """Displays the application version."""
         print(get_version())
 
+    @cmd2.with_argparser(run_parser)
+    def do_run(self, args: argparse.Namespace) -> None:
+        """Runs a campaign. Use -b to run it as a background job."""
+        try:
+            with open(args.prompts, "r") as f:
+                prompts = [line.strip() for line in f if line.strip()]
+        except OSError as ex:
+            Console.Write.error(f"Unable to read prompts: {ex}")
+            return
+        if not prompts:
+            Console.Write.warn("Prompts file is empty.")
+            return
+        llm_args: Dict[str, Any] = {"model": args.model}
+        if args.host:
+            llm_args["host"] = args.host
+        try:
+            coordinator = self._turing.start_campaign(
+                prompts,
+                args.llm,
+                llm_args=llm_args,
+                system_prompt=args.system,
+                workers=args.workers,
+                unit_size=args.unit_size,
+                address=parse_address(args.listen),
+                authkey=args.authkey.encode() if args.authkey else None
+            )
+        except Exception as ex:
+            Console.Write.error(f"Unable to start campaign: {ex}")
+            return
+        job = self._turing.jobs.add(f"{args.llm}/{args.model} ({len(prompts)} prompts)", coordinator)
+        Console.Write.success(f"Job {job.job_id} coordinator listening on {format_address(coordinator.address)}")
+        if args.background:
+            Console.Write.success(f"Job {job.job_id} started in the background.")
+            return
+        try:
+            while not job.join(PROGRESS_INTERVAL):
+                self.poutput(self._format_progress(job))
+        except KeyboardInterrupt:
+            job.kill()
+            job.join()
+        self._announced.add(job.job_id)
+        self.poutput(self._format_progress(job))
+
+    def do_jobs(self, _) -> None:
+        """Lists jobs."""
+        jobs = self._turing.jobs.list()
+        if not jobs:
+            Console.Write.warn("No jobs.")
+            return
+        for job in jobs:
+            self.poutput(f"{self._format_progress(job)} | {job.description}")
+
+    @cmd2.with_argparser(job_parser)
+    def do_job(self, args: argparse.Namespace) -> None:
+        """Displays a job's progress and most recent results."""
+        try:
+            job = self._turing.jobs.get(args.job_id)
+        except KeyError as ex:
+            Console.Write.error(ex.args[0])
+            return
+        self.poutput(self._format_progress(job))
+        if job.error:
+            Console.Write.error(job.error)
+        records: List[Dict[str, Any]] = []
+        for result in job.results:
+            if result.ok:
+                records.extend(result.value or [])
+            else:
+                records.append({"prompt": f"(unit {result.unit_id})", "response": None, "error": result.error.strip().splitlines()[-1]})
+        for record in records[-args.count:] if args.count > 0 else []:
+            self.poutput(f"{Console.color_text('>', [Console.Color.MAGENTA])} {record['prompt']}")
+            if record.get("error"):
+                self.poutput(Console.color_text(f"  {record['error']}", [Console.Color.RED]))
+            else:
+                self.poutput(f"  {record['response']}")
+
+    @cmd2.with_argparser(kill_parser)
+    def do_kill(self, args: argparse.Namespace) -> None:
+        """Kills a running job."""
+        try:
+            job = self._turing.jobs.get(args.job_id)
+        except KeyError as ex:
+            Console.Write.error(ex.args[0])
+            return
+        if not job.is_running:
+            Console.Write.warn(f"Job {job.job_id} is not running.")
+            return
+        job.kill()
+        Console.Write.success(f"Job {job.job_id} killed.")
+
 
     #get               Gets the value of a context-specific variable
     #getg              Gets the value of a global variable
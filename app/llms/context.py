@@ -0,0 +1,187 @@
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Tuple
+
+from app.core.exceptions import ContextOverflowError
+
+DEFAULT_CONTEXT_LENGTH: int = 4096
+DEFAULT_RESERVE_TOKENS: int = 512
+CHARS_PER_TOKEN: float = 4.0
+MESSAGE_OVERHEAD: int = 4
+CACHE_SIZE: int = 4096
+MIN_SUMMARY_CHARS: int = 64
+TRUNCATION_MARKER: str = " ..."
+
+Message = Dict[str, str]
+
+
+def excerpt_compactor(messages: List[Message], max_chars: int = 1000) -> str:
+    """
+    Default compactor. Condenses dropped turns into a short transcript excerpt without calling a model.
+
+    Args:
+        messages (List[Message]):   The oldest turns being dropped from the window.
+        max_chars (int):            The maximum length of the excerpt.
+
+    Returns:
+        str: The excerpt, keeping the most recent dropped text.
+    """
+    transcript = "\n".join(f"{message['role']}: {message['content']}" for message in messages)
+    if len(transcript) > max_chars:
+        transcript = "..." + transcript[-max_chars:]
+    return f"Summary of earlier conversation (truncated):\n{transcript}"
+
+
+class ContextManager:
+    """
+    Keeps a model's request messages within a token budget.
+
+    Token counts are estimated from message length and cached per message, so only messages added since the
+    previous turn are measured. The estimate is scaled by a ratio calibrated against the prompt token counts
+    the server reports. When the history does not fit, the system prompt and the new prompt are pinned and
+    the oldest turns are dropped, or replaced with a single compacted message if a compactor is set.
+    """
+    def __init__(
+            self,
+            context_length: int = DEFAULT_CONTEXT_LENGTH,
+            reserve_tokens: int = DEFAULT_RESERVE_TOKENS,
+            compactor: Optional[Callable[[List[Message]], str]] = None
+    ) -> None:
+        """
+        Initialize a ContextManager.
+
+        Args:
+            context_length (int):           The model's context window, in tokens.
+            reserve_tokens (int):           Tokens held back for the model's response.
+            compactor (Optional[Callable]): Optional function that condenses dropped turns into a single string.
+                                            Dropped turns are discarded when omitted.
+
+        Raises:
+            ValueError: If the reserve leaves no room for the prompt.
+        """
+        if reserve_tokens >= context_length:
+            raise ValueError(f"Reserve tokens ({reserve_tokens}) must be less than the context length ({context_length})")
+        self.context_length = context_length
+        self.reserve_tokens = reserve_tokens
+        self.compactor = compactor
+        self._scale = 1.0
+        self._cache: "OrderedDict[Tuple[str, str], int]" = OrderedDict()
+        self._summary: Optional[Tuple[Tuple[Tuple[str, str], ...], Message]] = None
+        self._last_raw = 0
+        self._fitted = False
+        self._window_start: Optional[Tuple[str, str]] = None
+        self._calibratable = False
+
+
+    #################################################################################
+    #   Private Methods                                                             #
+    #################################################################################
+    def _raw_tokens(self, message: Message) -> int:
+        key = (message["role"], message["content"])
+        tokens = self._cache.get(key)
+        if tokens is None:
+            tokens = int(len(message["content"]) / CHARS_PER_TOKEN) + MESSAGE_OVERHEAD
+            self._cache[key] = tokens
+            if len(self._cache) > CACHE_SIZE:
+                self._cache.popitem(last=False)
+        return tokens
+
+    def _compact(self, dropped: List[Message]) -> Message:
+        # key on every dropped message so conversations sharing a client never share a summary; the strings
+        # are the history's own objects, so building and comparing the key is cheap
+        key = tuple((message["role"], message["content"]) for message in dropped)
+        if self._summary is None or self._summary[0] != key:
+            summary = dict(role="system", content=self.compactor(dropped))
+            self._summary = (key, summary)
+        return self._summary[1]
+
+    def _fit_summary(self, summary: Message, room: float) -> Optional[Message]:
+        """Truncates a summary to fit in `room` unscaled tokens, or returns None if too little room is left."""
+        if self._raw_tokens(summary) <= room:
+            return summary
+        max_chars = int((room - MESSAGE_OVERHEAD) * CHARS_PER_TOKEN) - len(TRUNCATION_MARKER)
+        if max_chars < MIN_SUMMARY_CHARS:
+            return None
+        return dict(role=summary["role"], content=summary["content"][:max_chars] + TRUNCATION_MARKER)
+
+
+    #################################################################################
+    # PUBLIC PROPERTIES                                                             #
+    #################################################################################
+    @property
+    def budget(self) -> int:
+        """Tokens available for the request messages."""
+        return self.context_length - self.reserve_tokens
+
+    @property
+    def last_estimate(self) -> int:
+        """The estimated prompt tokens of the most recently fitted request."""
+        return int(self._last_raw * self._scale)
+
+
+    #################################################################################
+    # PUBLIC METHODS                                                                #
+    #################################################################################
+    def estimate(self, messages: List[Message]) -> int:
+        """Returns the estimated token count of a list of messages."""
+        return int(sum(self._raw_tokens(message) for message in messages) * self._scale)
+
+    def observe(self, prompt_tokens: int) -> None:
+        """
+        Calibrates the estimate against the prompt token count the server reported for the last request.
+
+        Servers that reuse a cached prompt prefix only report the newly evaluated tokens, so only requests that
+        could not have reused the previous request's prefix are used: the first request, or one whose window
+        start moved. The scale never drops below 1.0, since the pinned system prompt can still be cached.
+
+        Args:
+            prompt_tokens (int):    The server-reported prompt token count.
+        """
+        if prompt_tokens <= 0 or self._last_raw <= 0 or not self._calibratable:
+            return
+        self._calibratable = False
+        self._scale = max(1.0, 0.7 * self._scale + 0.3 * (prompt_tokens / self._last_raw))
+
+    def fit(self, pinned_head: List[Message], history: List[Message], pinned_tail: List[Message]) -> List[Message]:
+        """
+        Builds request messages that fit the budget.
+
+        Args:
+            pinned_head (List[Message]):    Messages always sent first (e.g., the system prompt).
+            history (List[Message]):        Prior turns, oldest first. The most recent turns are kept.
+            pinned_tail (List[Message]):    Messages always sent last (e.g., the new user prompt).
+
+        Returns:
+            List[Message]: The request messages.
+
+        Raises:
+            ContextOverflowError: If the pinned messages alone exceed the budget.
+        """
+        # work in unscaled estimates so each cached count is used as-is
+        budget = self.budget / self._scale
+        used = sum(self._raw_tokens(message) for message in pinned_head + pinned_tail)
+        if used > budget:
+            raise ContextOverflowError(
+                f"Prompt needs ~{int(used * self._scale)} tokens but only {self.budget} of the "
+                f"{self.context_length} token context are available."
+            )
+        start = len(history)
+        while start > 0 and used + self._raw_tokens(history[start - 1]) <= budget:
+            start -= 1
+            used += self._raw_tokens(history[start])
+        # don't open the window on a reply whose prompt was dropped
+        while 0 < start < len(history) and history[start]["role"] == "assistant":
+            used -= self._raw_tokens(history[start])
+            start += 1
+        kept = history[start:]
+        if start and self.compactor:
+            # the summary only uses room the window left over, so compaction never keeps fewer turns
+            summary = self._fit_summary(self._compact(history[:start]), budget - used)
+            if summary:
+                used += self._raw_tokens(summary)
+                kept = [summary] + kept
+        window_start = (kept[0]["role"], kept[0]["content"]) if kept else None
+        self._calibratable = not self._fitted or window_start != self._window_start
+        self._fitted = True
+        self._window_start = window_start
+        self._last_raw = used
+        return pinned_head + kept + pinned_tail
@@ -1,7 +1,8 @@
 import requests
 
-from typing import Optional, List, Dict, TypedDict, Any
+from typing import Optional, List, Dict, TypedDict, Any, Callable
 from app.llms.base import LLMClient
+from app.llms.context import ContextManager, DEFAULT_CONTEXT_LENGTH, DEFAULT_RESERVE_TOKENS
 from app.llms.registry import register_llm
 from app.core.exceptions import HostVerificationError, ModelVerificationError, ChatResponseError
 
@@ -19,7 +20,14 @@ class OllamaLLM(LLMClient):
     By default, connects to a local instance ({DEFAULT_URL}), but
     can connect to any accessible Ollama API endpoint.
     """
-    def __init__(self, model: str, host: Optional[str] = DEFAULT_URL) -> None:
+    def __init__(
+            self,
+            model: str,
+            host: Optional[str] = DEFAULT_URL,
+            context_length: Optional[int] = None,
+            reserve_tokens: int = DEFAULT_RESERVE_TOKENS,
+            compactor: Optional[Callable[[List[OllamaMessage]], str]] = None
+    ) -> None:
         f"""
         Initialize an OllamaLLM client.
 
@@ -29,6 +37,15 @@ class OllamaLLM(LLMClient):
             host (Optional[str]):   The base URL for the Ollama API. Defaults to '{DEFAULT_URL}',
                                     which is the standard location for local/self-hosted Ollama instances.
                                     For remote instances, provide the appropriate URL.
+            context_length (Optional[int]): The context window, in tokens. Requests are budgeted against it and it
+                                            is sent to the server as 'num_ctx', so the server allocates the same
+                                            window instead of truncating at its own default. Defaults to the model's
+                                            'num_ctx' parameter if set, otherwise the smaller of the model's trained
+                                            context length and {DEFAULT_CONTEXT_LENGTH}.
+            reserve_tokens (int):           Tokens of the context window held back for the response.
+            compactor (Optional[Callable]): Optional function that condenses history dropped from the window into a
+                                            single message (see app.llms.context.excerpt_compactor). Dropped history
+                                            is omitted from the request when not provided.
 
         Raises:
             HostVerificationError:  If the Ollama server is unreachable or otherwise unavailable.
@@ -45,6 +62,11 @@ class OllamaLLM(LLMClient):
             raise HostVerificationError(f"Host {host} is invalid.")
         self._verify_server()
         self._verify_model()
+        self.context = ContextManager(
+            context_length=context_length or self._detect_context_length(),
+            reserve_tokens=reserve_tokens,
+            compactor=compactor
+        )
     
     def _verify_server(self) -> None:
         """
@@ -76,6 +98,26 @@ class OllamaLLM(LLMClient):
                 f"Use 'ollama pull {self.model.split(':')[0]}' to download."
             )
         
+    def _detect_context_length(self) -> int:
+        """
+        Looks up the model's context window. Falls back to the default if the server does not report one.
+        """
+        try:
+            response = requests.post(f"{self.host}/api/show", json={"model": self.model}, timeout=2)
+            response.raise_for_status()
+            details: Dict[str, Any] = response.json()
+        except Exception:
+            return DEFAULT_CONTEXT_LENGTH
+        # a num_ctx set in the modelfile is the window the model was configured to run with
+        for line in (details.get("parameters") or "").splitlines():
+            parts = line.split()
+            if len(parts) == 2 and parts[0] == "num_ctx" and parts[1].isdigit():
+                return int(parts[1])
+        for key, value in (details.get("model_info") or {}).items():
+            if key.endswith(".context_length") and isinstance(value, int):
+                return min(value, DEFAULT_CONTEXT_LENGTH)
+        return DEFAULT_CONTEXT_LENGTH
+
     def chat(
             self,
             prompt: str,
@@ -84,7 +126,10 @@ class OllamaLLM(LLMClient):
     ) -> tuple[str, List[OllamaMessage]]:
         """
         Sends a prompt to the Ollama model and return its response.
-        This method also allows for optional history and system prompt for context.
+        This method also allows for optional history and system prompt for context. History that does not fit
+        the model's context window is windowed (and optionally compacted) by `self.context`; the system prompt
+        and new prompt are always sent. Requests use the native /api/chat endpoint so the context window can be
+        passed to the server as 'num_ctx'.
 
         Args:
             prompt (str):                               The user prompt to send to the model.
@@ -93,22 +138,34 @@ class OllamaLLM(LLMClient):
 
         Returns:
             tuple[str, List[OllamaMessage]]: The LLM response text and update chat history.
+
+        Raises:
+            ContextOverflowError:   If the system prompt and prompt alone exceed the context budget. No request is sent.
         """
-        url: str = f"{self.host}/v1/chat/completions"
-        messages: List[OllamaMessage] = []
+        url: str = f"{self.host}/api/chat"
         history = history[:] if history else []
-        if system_prompt and (not history[0]["role"] != "system"):
-            system_message = OllamaMessage(role="system", content=system_prompt)
-            messages.append(system_message)
-        if history:
-            messages.extend(history)
+        pinned: List[OllamaMessage] = []
+        if history and history[0]["role"] == "system":
+            pinned.append(history[0])
+            earlier = history[1:]
+        else:
+            earlier = history
+            if system_prompt:
+                pinned.append(OllamaMessage(role="system", content=system_prompt))
         new_message: OllamaMessage = OllamaMessage(role="user", content=prompt)
-        messages.append(new_message)
-        payload: Dict[str, Any] = { "model": self.model, "messages": messages }
+        messages: List[OllamaMessage] = self.context.fit(pinned, earlier, [new_message])
+        payload: Dict[str, Any] = {
+            "model": self.model,
+            "messages": messages,
+            "stream": False,
+            "options": { "num_ctx": self.context.context_length }
+        }
         response: requests.Response = requests.post(url, json=payload)
         response.raise_for_status()
-        llm_response: str = response.json()["choices"][0]["message"]["content"] or ""
-        response_message: OllamaMessage = OllamaMessage(role="assistant", content="llm_response")
+        body: Dict[str, Any] = response.json()
+        self.context.observe(body.get("prompt_eval_count") or 0)
+        llm_response: str = body["message"]["content"] or ""
+        response_message: OllamaMessage = OllamaMessage(role="assistant", content=llm_response)
         history.append(new_message)
         history.append(response_message)
         return llm_response, history
@@ -0,0 +1,63 @@
+from app.llms.context import ContextManager, excerpt_compactor
+
+SYSTEM = [{"role": "system", "content": "be helpful"}]
+PROMPT = [{"role": "user", "content": "next question"}]
+
+def make_history(turns: int):
+    history = []
+    for i in range(turns):
+        history.append({"role": "user", "content": f"q{i} " + "x" * 80})
+        history.append({"role": "assistant", "content": f"a{i} " + "y" * 80})
+    return history
+
+
+def test_window_keeps_most_recent_turns_and_pins_prompts():
+    history = make_history(20)
+    messages = ContextManager(200, 50).fit(SYSTEM, history, PROMPT)
+    assert messages[0] == SYSTEM[0] and messages[-1] == PROMPT[0]
+    assert messages[1:-1] == history[-4:]
+
+def test_compaction_never_keeps_fewer_turns_than_windowing():
+    history = make_history(20)
+    calls = []
+    def compactor(dropped):
+        calls.append(len(dropped))
+        return excerpt_compactor(dropped)
+    manager = ContextManager(200, 50, compactor)
+    messages = manager.fit(SYSTEM, history, PROMPT)
+    assert messages[-5:-1] == history[-4:]
+    assert messages[1]["content"].startswith("Summary of earlier conversation")
+    assert manager.last_estimate <= manager.budget
+    manager.fit(SYSTEM, history, PROMPT)
+    assert calls == [36]
+
+def test_summaries_are_not_shared_between_conversations():
+    refusal = "I'm sorry, I can't help with that."
+    def conversation(name):
+        history = []
+        for i in range(10):
+            history.append({"role": "user", "content": f"{name} question {i} " + "x" * 60})
+            history.append({"role": "assistant", "content": refusal})
+        return history
+    manager = ContextManager(200, 50, excerpt_compactor)
+    manager.fit(SYSTEM, conversation("ALICE"), PROMPT)
+    summary = manager.fit(SYSTEM, conversation("BOB"), PROMPT)[1]["content"]
+    assert "BOB" in summary and "ALICE" not in summary
+
+def test_observe_only_calibrates_requests_that_cannot_hit_the_prompt_cache():
+    history = make_history(20)
+    manager = ContextManager(200, 50)
+    manager.fit(SYSTEM, history, PROMPT)
+    manager.observe(manager.last_estimate * 2)
+    raised = manager.estimate(PROMPT)
+    assert raised > ContextManager(200, 50).estimate(PROMPT)
+    # same window start as the previous request: a prefix-cache hit, so the report is ignored
+    manager.fit(SYSTEM, history, PROMPT)
+    manager.observe(manager.last_estimate * 4)
+    assert manager.estimate(PROMPT) == raised
+
+def test_observe_never_lowers_scale_below_one():
+    manager = ContextManager(200, 50)
+    manager.fit(SYSTEM, make_history(2), PROMPT)
+    manager.observe(1)
+    assert manager.estimate(PROMPT) == ContextManager(200, 50).estimate(PROMPT)
@@ -0,0 +1,149 @@
+import os
+import signal
+import socket
+import threading
+import time
+
+from multiprocessing.connection import Client
+
+from app.core.fabric import (
+    MSG_ACK, MSG_PULL, MSG_RESULT, MSG_UNIT, Coordinator, WorkResult, WorkUnit, Worker, shard_campaign
+)
+
+def stub_handler(unit: WorkUnit, worker: Worker) -> int:
+    """Doubles payload['n']. On its first attempt a unit can exit or freeze its worker."""
+    time.sleep(unit.payload.get("sleep", 0.05))
+    if unit.attempts == 1 and unit.payload.get("fail") == "exit":
+        os._exit(1)
+    if unit.attempts == 1 and unit.payload.get("fail") == "freeze":
+        os.kill(os.getpid(), signal.SIGSTOP)
+    return unit.payload["n"] * 2
+
+def make_coordinator(**kwargs) -> Coordinator:
+    kwargs.setdefault("heartbeat_timeout", 1.0)
+    kwargs.setdefault("poll_interval", 0.05)
+    return Coordinator(**kwargs).start()
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+def kill_processes(coordinator: Coordinator) -> None:
+    for process in coordinator._processes:
+        process.kill()
+    coordinator.stop(timeout=1)
+
+
+def test_all_units_complete_across_local_workers():
+    coordinator = make_coordinator()
+    try:
+        coordinator.submit([WorkUnit(payload={"n": n}) for n in range(12)])
+        coordinator.close()
+        coordinator.spawn_local_workers(3, handler=stub_handler, heartbeat_interval=0.2)
+        results = coordinator.wait(timeout=30)
+        assert sorted(result.value for result in results.values()) == [n * 2 for n in range(12)]
+        assert all(result.ok and result.attempts == 1 for result in results.values())
+    finally:
+        kill_processes(coordinator)
+
+def test_unit_requeued_when_worker_exits_at_end_of_campaign():
+    coordinator = make_coordinator()
+    try:
+        coordinator.submit([WorkUnit(payload={"n": 0}), WorkUnit(payload={"n": 1, "sleep": 0.3, "fail": "exit"})])
+        coordinator.close()
+        coordinator.spawn_local_workers(2, handler=stub_handler, heartbeat_interval=0.2)
+        results = coordinator.wait(timeout=30)
+        assert sorted(result.value for result in results.values()) == [0, 2]
+        assert max(result.attempts for result in results.values()) == 2
+        assert coordinator.progress == (2, 2)
+    finally:
+        kill_processes(coordinator)
+
+def test_unit_reassigned_when_heartbeats_stop():
+    coordinator = make_coordinator(heartbeat_timeout=0.8)
+    try:
+        coordinator.submit([WorkUnit(payload={"n": 3, "fail": "freeze"})])
+        coordinator.close()
+        coordinator.spawn_local_workers(2, handler=stub_handler, heartbeat_interval=0.2)
+        (result,) = coordinator.wait(timeout=30).values()
+        assert result.value == 6
+        assert result.attempts == 2
+    finally:
+        kill_processes(coordinator)
+
+def test_duplicate_results_are_dropped():
+    coordinator = make_coordinator()
+    try:
+        (unit_id,) = coordinator.submit([WorkUnit(payload={"n": 1})])
+        with Client(coordinator.address, authkey=coordinator.authkey) as conn:
+            conn.send((MSG_PULL, "raw"))
+            kind, unit = conn.recv()
+            assert kind == MSG_UNIT and unit.unit_id == unit_id
+            for value in ("first", "second"):
+                conn.send((MSG_RESULT, "raw", WorkResult(unit_id=unit_id, worker_id="raw", value=value)))
+                assert conn.recv() == (MSG_ACK, unit_id)
+        results = list(coordinator.iter_results(timeout=5))
+        assert [result.value for result in results] == ["first"]
+        assert coordinator.wait(timeout=1)[unit_id].value == "first"
+    finally:
+        coordinator.stop(timeout=1)
+
+def test_unacknowledged_result_redelivered_after_reconnect():
+    coordinator = make_coordinator()
+    try:
+        (unit_id,) = coordinator.submit([WorkUnit(payload={"n": 4})])
+        coordinator.close()
+        # lease the unit on a connection that then drops, leaving the result unacknowledged
+        with Client(coordinator.address, authkey=coordinator.authkey) as conn:
+            conn.send((MSG_PULL, "lost"))
+            assert conn.recv()[0] == MSG_UNIT
+        worker = Worker(coordinator.address, coordinator.authkey, handler=stub_handler)
+        worker._unacked = WorkResult(unit_id=unit_id, worker_id=worker.worker_id, value="redelivered", attempts=1)
+        worker.run()
+        result = coordinator.wait(timeout=5)[unit_id]
+        assert result.value == "redelivered"
+        assert result.attempts == 1
+    finally:
+        coordinator.stop(timeout=1)
+
+def test_worker_retries_until_coordinator_is_listening():
+    address = ("127.0.0.1", free_port())
+    authkey = b"secret"
+    worker = Worker(address, authkey, handler=stub_handler, max_reconnects=10)
+    thread = threading.Thread(target=worker.run, daemon=True)
+    thread.start()
+    time.sleep(0.3)
+    coordinator = make_coordinator(address=address, authkey=authkey)
+    try:
+        coordinator.submit([WorkUnit(payload={"n": 5})])
+        coordinator.close()
+        (result,) = coordinator.wait(timeout=10).values()
+        assert result.value == 10
+        thread.join(5)
+        assert not thread.is_alive()
+    finally:
+        coordinator.stop(timeout=1)
+
+def test_shard_campaign_splits_prompts_in_order():
+    units = shard_campaign([f"p{i}" for i in range(25)], "ollama", llm_args={"model": "m"}, unit_size=10)
+    assert [len(unit.payload["prompts"]) for unit in units] == [10, 10, 5]
+    assert units[2].payload["prompts"][-1] == "p24"
+    assert units[0].payload["llm_args"] == {"model": "m"}
+
+def test_silent_peer_does_not_block_workers_or_stop():
+    coordinator = make_coordinator()
+    silent = socket.create_connection(coordinator.address)
+    try:
+        coordinator.submit([WorkUnit(payload={"n": 6})])
+        coordinator.close()
+        worker = Worker(coordinator.address, coordinator.authkey, handler=stub_handler)
+        thread = threading.Thread(target=worker.run, daemon=True)
+        thread.start()
+        (result,) = coordinator.wait(timeout=5).values()
+        assert result.value == 12
+    finally:
+        started = time.monotonic()
+        coordinator.stop(timeout=1)
+        assert time.monotonic() - started < 2
+        silent.close()
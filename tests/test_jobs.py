@@ -0,0 +1,119 @@
+import queue
+import threading
+import time
+
+import pytest
+
+from app.core.exceptions import FabricError
+from app.core.fabric import Coordinator, WorkResult, WorkUnit
+from app.core.jobs import STATE_DONE, STATE_FAILED, STATE_KILLED, JobManager, JobProgress
+from tests.test_fabric import stub_handler
+
+class StubCoordinator:
+    """Feeds queued results (or an exception) to a Job; None ends the stream."""
+    def __init__(self, total: int) -> None:
+        self.total = total
+        self.done = 0
+        self.stop_calls = []
+        self._queue: "queue.Queue" = queue.Queue()
+
+    @property
+    def progress(self):
+        return self.done, self.total
+
+    def feed(self, item) -> None:
+        self._queue.put(item)
+
+    def iter_results(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            if isinstance(item, Exception):
+                raise item
+            self.done += 1
+            yield item
+
+    def stop(self, timeout: float = 5.0) -> None:
+        self.stop_calls.append(timeout)
+        self._queue.put(None)
+
+def records(*errors):
+    return [{"prompt": "p", "response": None if error else "r", "error": error} for error in errors]
+
+
+def test_progress_math():
+    progress = JobProgress(units_done=2, units_total=5, items=20, errors=5, elapsed=4.0)
+    assert progress.throughput == 5.0
+    assert progress.error_rate == 0.25
+    assert progress.eta == 6.0
+    empty = JobProgress(units_done=0, units_total=5, items=0, errors=0, elapsed=0.0)
+    assert (empty.throughput, empty.error_rate, empty.eta) == (0.0, 0.0, None)
+
+def test_job_done_counts_records_and_failed_units():
+    coordinator = StubCoordinator(total=2)
+    job = JobManager().add("stub", coordinator)
+    coordinator.feed(WorkResult(unit_id="a", worker_id="w", value=records(None, "boom", None), size=3))
+    coordinator.feed(WorkResult(unit_id="b", worker_id="w", error="Traceback", size=4))
+    coordinator.feed(None)
+    assert job.join(5)
+    progress = job.progress
+    assert job.state == STATE_DONE
+    assert (progress.units_done, progress.items, progress.errors) == (2, 7, 5)
+    assert [result.unit_id for result in job.results] == ["a", "b"]
+
+def test_job_failed_when_results_raise():
+    coordinator = StubCoordinator(total=1)
+    job = JobManager().add("stub", coordinator)
+    coordinator.feed(FabricError("1 unit(s) outstanding with no live workers."))
+    assert job.join(5)
+    assert job.state == STATE_FAILED
+    assert "no live workers" in job.error
+    assert coordinator.stop_calls == [0]
+
+def test_kill_is_not_overwritten_by_collector():
+    coordinator = StubCoordinator(total=3)
+    job = JobManager().add("stub", coordinator)
+    coordinator.feed(WorkResult(unit_id="a", worker_id="w", value=records(None)))
+    job.kill()
+    assert job.join(5)
+    assert job.state == STATE_KILLED
+    assert not job.is_running
+
+def test_kill_racing_completion_settles_on_one_state():
+    for _ in range(50):
+        coordinator = StubCoordinator(total=1)
+        job = JobManager().add("stub", coordinator)
+        coordinator.feed(WorkResult(unit_id="a", worker_id="w", value=records(None)))
+        coordinator.feed(None)
+        killer = threading.Thread(target=job.kill)
+        killer.start()
+        killer.join()
+        assert job.join(5)
+        state = job.state
+        assert state in (STATE_DONE, STATE_KILLED)
+        elapsed = job.progress.elapsed
+        time.sleep(0.01)
+        assert job.progress.elapsed == elapsed
+        assert job.state == state
+
+def test_manager_get_rejects_unknown_ids():
+    manager = JobManager()
+    job = manager.add("stub", StubCoordinator(total=0))
+    assert manager.get(str(job.job_id)) is job
+    for bad in ("abc", 99, None):
+        with pytest.raises(KeyError):
+            manager.get(bad)
+
+def test_job_fails_when_local_workers_are_gone():
+    coordinator = Coordinator(heartbeat_timeout=1.0, poll_interval=0.05).start()
+    coordinator.submit([WorkUnit(payload={"n": 1, "fail": "exit"})])
+    coordinator.close()
+    coordinator.spawn_local_workers(1, handler=stub_handler, heartbeat_interval=0.2)
+    job = JobManager().add("stalled", coordinator)
+    try:
+        assert job.join(30)
+        assert job.state == STATE_FAILED
+        assert "no live workers" in job.error
+    finally:
+        coordinator.stop(timeout=1)
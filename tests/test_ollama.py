@@ -0,0 +1,81 @@
+from unittest import mock
+
+import pytest
+
+from app.core.exceptions import ContextOverflowError
+from app.llms.ollama import OllamaLLM
+
+MODEL = "mistral:latest"
+
+def response(body):
+    fake = mock.Mock()
+    fake.json.return_value = body
+    fake.raise_for_status.return_value = None
+    return fake
+
+def chat_body(content, prompt_eval_count=0):
+    return {"message": {"role": "assistant", "content": content}, "prompt_eval_count": prompt_eval_count, "done": True}
+
+@pytest.fixture
+def requests_mock():
+    with mock.patch("app.llms.ollama.requests") as patched:
+        patched.get.return_value = response({"data": [{"id": MODEL}]})
+        patched.post.return_value = response({"parameters": "num_ctx 8192", "model_info": {}})
+        yield patched
+
+def make_client(requests_mock, **kwargs):
+    client = OllamaLLM(MODEL, **kwargs)
+    requests_mock.post.reset_mock()
+    return client
+
+
+def test_context_length_detected_from_model_parameters(requests_mock):
+    assert make_client(requests_mock).context.context_length == 8192
+    requests_mock.post.return_value = response({"parameters": "", "model_info": {"llama.context_length": 131072}})
+    assert make_client(requests_mock).context.context_length == 4096
+
+def test_chat_posts_native_payload_with_num_ctx(requests_mock):
+    client = make_client(requests_mock, context_length=2048)
+    requests_mock.post.return_value = response(chat_body("hello there", prompt_eval_count=12))
+    text, history = client.chat("hi", system_prompt="be brief")
+    (url,), kwargs = requests_mock.post.call_args
+    payload = kwargs["json"]
+    assert url == "http://localhost:11434/api/chat"
+    assert payload["stream"] is False
+    assert payload["options"] == {"num_ctx": 2048}
+    assert payload["messages"] == [{"role": "system", "content": "be brief"}, {"role": "user", "content": "hi"}]
+    assert text == "hello there"
+    assert history == [{"role": "user", "content": "hi"}, {"role": "assistant", "content": "hello there"}]
+
+def test_existing_system_message_is_pinned(requests_mock):
+    client = make_client(requests_mock, context_length=200, reserve_tokens=50)
+    requests_mock.post.return_value = response(chat_body("ok"))
+    history = [{"role": "system", "content": "original system"}]
+    for i in range(20):
+        history.append({"role": "user", "content": f"q{i} " + "x" * 80})
+        history.append({"role": "assistant", "content": f"a{i} " + "y" * 80})
+    client.chat("next", history=history, system_prompt="ignored")
+    messages = requests_mock.post.call_args.kwargs["json"]["messages"]
+    assert messages[0] == {"role": "system", "content": "original system"}
+    assert messages[-1] == {"role": "user", "content": "next"}
+    assert "ignored" not in [message["content"] for message in messages]
+    assert len(messages) < len(history) + 1
+
+def test_overflow_raises_before_any_request(requests_mock):
+    client = make_client(requests_mock, context_length=200, reserve_tokens=50)
+    with pytest.raises(ContextOverflowError):
+        client.chat("z" * 2000)
+    requests_mock.post.assert_not_called()
+
+def test_prompt_eval_count_calibrates_first_request_only(requests_mock):
+    client = make_client(requests_mock, context_length=2048)
+    baseline = client.context.estimate([{"role": "user", "content": "x" * 400}])
+    requests_mock.post.return_value = response(chat_body("ok", prompt_eval_count=client.context.estimate(
+        [{"role": "user", "content": "x" * 400}]) * 3))
+    client.chat("x" * 400)
+    calibrated = client.context.estimate([{"role": "user", "content": "x" * 400}])
+    assert calibrated > baseline
+    # a repeat of the same conversation start may reuse the prompt cache; its count is ignored
+    requests_mock.post.return_value = response(chat_body("ok", prompt_eval_count=1))
+    client.chat("x" * 400)
+    assert client.context.estimate([{"role": "user", "content": "x" * 400}]) == calibrated